@@ -1,15 +1,60 @@
+import sys
+import types
+import weakref
+from array import array
 from datetime import date
-from collections import defaultdict
+from functools import lru_cache
+
+def _avg_age_kernel(birth_ord, death_ord):
+    """Average age at death over the flat ordinal arrays.
+
+    Written as a free function whose loop touches only local ints and the
+    two arrays, so a JIT compiler could take it as-is; under CPython it
+    still avoids any attribute or method lookups per element.
+    """
+    total = 0
+    count = 0
+    for i in range(len(birth_ord)):
+        death = death_ord[i]
+        if death >= 0:
+            total += (death - birth_ord[i]) // 365
+            count += 1
+    return total / count if count else 0
+
+def _child_counts_kernel(indptr):
+    """Per-person child counts from the CSR indptr array."""
+    return [indptr[i + 1] - indptr[i] for i in range(len(indptr) - 1)]
+
+def _bit_ids(mask):
+    """Decode an int bitmask into the ids of its set bits, ascending."""
+    ids = []
+    while mask:
+        low = mask & -mask
+        ids.append(low.bit_length() - 1)
+        mask ^= low
+    return ids
+
 
 class PersonBase:
     """Base class for all people in the family tree."""
+    __slots__ = ('_id', '_name', '_birth_date', '_birth_ord', '_birth_m', '_birth_d',
+                 '_spouse', '__weakref__')
+
     def __init__(self, name, birth_date):
+        self._id = None  # Integer id, assigned when added to a FamilyTree
         self._name = name  # Name of the person
         self._birth_date = birth_date  # Birth date of the person
-        self._parents = []  # List of parents
-        self._children = []  # List of children
+        # Plain-int copies of the date fields, so the aggregate passes
+        # never re-derive ordinals or allocate timedeltas per person
+        self._birth_ord = birth_date.toordinal()
+        self._birth_m = birth_date.month
+        self._birth_d = birth_date.day
         self._spouse = None  # Spouse, if any
 
+    @property
+    def id(self):
+        return self._id
+
     @property
     def name(self):
         return self._name
@@ -18,47 +63,32 @@ class PersonBase:
     def birth_date(self):
         return self._birth_date
 
-    @property
-    def parents(self):
-        return self._parents
-
-    @property
-    def children(self):
-        return self._children
-
     @property
     def spouse(self):
         return self._spouse
 
     @spouse.setter
     def spouse(self, spouse):
-        """Set spouse with reciprocal linking."""
+        """Set spouse with reciprocal linking.
+
+        The automatic back-link is a weakref proxy, so a married couple
+        does not form a strong reference cycle the generational GC would
+        have to trace."""
         self._spouse = spouse
-        spouse._spouse = self  # Automatically link the other way
+        spouse._spouse = weakref.proxy(self)
 
     def __str__(self):
         """Human-readable representation of a person."""
         return self.name
 
-    # Methods to set parents and children dynamically
-    def set_parents(self, parents):
-        """Set parents for this person."""
-        self._parents = parents
-        for parent in parents:
-            parent._children.append(self)  # Link this person as a child to each parent
-
-    def set_children(self, children):
-        """Set children for this person."""
-        self._children = children
-        for child in children:
-            child._parents.append(self)  # Link this person as a parent to each child
-
     def display_details(self):
         raise NotImplementedError("This method should be implemented in subclasses")
 
 
 class LivingPerson(PersonBase):
     """Subclass representing a living person."""
+    __slots__ = ()
+
     def display_details(self):
         """Details include that the person is alive."""
         return f"Name: {self.name}, Birth Date: {self.birth_date} (Alive)"
@@ -66,9 +96,12 @@ class LivingPerson(PersonBase):
 
 class DeceasedPerson(PersonBase):
     """Subclass representing a deceased person."""
+    __slots__ = ('_death_date', '_death_ord')
+
     def __init__(self, name, birth_date, death_date):
         super().__init__(name, birth_date)
         self._death_date = death_date  # Date of death for the person
+        self._death_ord = death_date.toordinal()
 
     @property
     def death_date(self):
@@ -82,6 +115,161 @@ class FamilyTree:
     """Class to manage family tree relationships and provide feature functionalities."""
     def __init__(self):
         self.members = {}  # Dictionary to store all family members by name
+        self._people = []  # Members indexed by integer id, in insertion order
+        self._name_to_id = {}  # Interned name -> integer id
+        self._edges = []  # Parent->child edges as (parent id, child id) pairs
+        # Structure-of-arrays: per-person scalars kept in flat, contiguous
+        # arrays keyed by id, so the aggregate methods never have to walk
+        # the person objects themselves.
+        self._names = []  # Name per id
+        self._birth_ord = array('l')  # Birth date as proleptic ordinal
+        self._death_ord = array('l')  # Death ordinal, or -1 if still alive
+        self._is_living = array('b')  # 1 if alive, 0 if deceased
+        # Parent/child edges in CSR (compressed-sparse-row) form: the
+        # neighbours of person i sit in idx[indptr[i]:indptr[i + 1]],
+        # built once by finalize() after all relationships are set.
+        self._parent_indptr = None
+        self._parent_idx = None
+        self._child_indptr = None
+        self._child_idx = None
+        # Memoized relationship answers keyed by (op, person id); the
+        # tree is immutable after finalize(), so entries never go stale.
+        self._result_cache = {}
+
+    def add_member(self, person):
+        """Add a person to the tree, assigning them the next integer id."""
+        person._id = len(self._people)
+        self._people.append(person)
+        name = sys.intern(person.name)
+        self.members[name] = person
+        self._name_to_id[name] = person._id
+        self._names.append(name)
+        self._birth_ord.append(person._birth_ord)
+        if hasattr(person, 'death_date'):  # Deceased; avoids an isinstance MRO walk
+            self._death_ord.append(person._death_ord)
+            self._is_living.append(0)
+        else:
+            self._death_ord.append(-1)
+            self._is_living.append(1)
+
+    def add_edges(self, edges):
+        """Register all parent->child edges in one pass, by name.
+
+        Replaces the old per-person set_parents/set_children calls, which
+        each appended to the other side's list and could double-link an
+        edge registered from both ends.
+        """
+        name_to_id = self._name_to_id
+        self._edges.extend((name_to_id[p], name_to_id[c]) for p, c in edges)
+
+    def finalize(self):
+        """Freeze the tree: pack parent/child edges into CSR adjacency arrays.
+
+        Call once after all members and edges are in place; the
+        relationship queries read these flat arrays instead of chasing
+        per-person list objects.
+        """
+        n = len(self._people)
+        # Count-scan-scatter: count the degree of each person, form the
+        # indptr arrays by exclusive scan, then scatter edge endpoints
+        # into the flat idx buffers at the running cursor positions.
+        parent_count = [0] * n
+        child_count = [0] * n
+        for p, c in self._edges:
+            parent_count[c] += 1
+            child_count[p] += 1
+        parent_indptr = array('l', [0])
+        child_indptr = array('l', [0])
+        for pid in range(n):
+            parent_indptr.append(parent_indptr[pid] + parent_count[pid])
+            child_indptr.append(child_indptr[pid] + child_count[pid])
+        parent_idx = array('l', [0]) * parent_indptr[n]
+        child_idx = array('l', [0]) * child_indptr[n]
+        parent_cursor = list(parent_indptr[:n])
+        child_cursor = list(child_indptr[:n])
+        for p, c in self._edges:
+            parent_idx[parent_cursor[c]] = p
+            parent_cursor[c] += 1
+            child_idx[child_cursor[p]] = c
+            child_cursor[p] += 1
+        self._parent_indptr = parent_indptr
+        self._child_indptr = child_indptr
+        self._parent_idx = parent_idx
+        self._child_idx = child_idx
+        # The tree is static once finalized, so sibling/cousin/grandparent
+        # sets are computed here once and the find_* methods reduce to
+        # table lookups.
+        # Children of each person as one int bitmask (bit c set when c is
+        # a child), so the sibling union and self-exclusion below are
+        # single machine-int operations instead of set churn.
+        self._children_mask = [0] * n
+        for pid in range(n):
+            mask = 0
+            for c in self._child_ids(pid):
+                mask |= 1 << c
+            self._children_mask[pid] = mask
+        self._grandparents = []
+        self._siblings = []
+        self._cousins = []
+        for pid in range(n):
+            parents = self._parent_ids(pid)
+            grandparent_ids = []
+            sibling_mask = 0
+            for p in parents:
+                grandparent_ids.extend(self._parent_ids(p))
+                sibling_mask |= self._children_mask[p]
+            sibling_mask &= ~(1 << pid)
+            self._grandparents.append(tuple(grandparent_ids))
+            self._siblings.append(tuple(_bit_ids(sibling_mask)))
+        for pid in range(n):
+            cousin_ids = []
+            for p in self._parent_ids(pid):
+                for uncle in self._siblings[p]:
+                    cousin_ids.extend(self._child_ids(uncle))
+            self._cousins.append(tuple(cousin_ids))
+        # Extended family is immediate family plus aunts/uncles and
+        # cousins, restricted to the living; precomputing it here removes
+        # the repeated set unions the old per-call traversal did.
+        self._extended_living = []
+        for pid in range(n):
+            extended = set(self._parent_ids(pid))
+            extended.update(self._siblings[pid])
+            extended.update(self._child_ids(pid))
+            spouse = self._people[pid].spouse
+            if spouse is not None:
+                extended.add(spouse.id)
+            for p in self._parent_ids(pid):
+                for uncle in self._siblings[p]:
+                    extended.add(uncle)
+                    extended.update(self._child_ids(uncle))
+            self._extended_living.append(tuple(sorted(
+                i for i in extended if self._is_living[i])))
+        # Birthday calendar, computed once: keys are (month << 5) | day
+        # packed ints bucketed into a fixed 13*32-slot array, so walking
+        # the buckets in index order is already chronological and neither
+        # hashing nor a final sort is needed.
+        buckets = [None] * (13 << 5)
+        for pid in range(n):
+            person = self._people[pid]
+            key = (person._birth_m << 5) | person._birth_d
+            if buckets[key] is None:
+                buckets[key] = []
+            buckets[key].append(self._names[pid])
+        self._birthday_calendar = {key: names for key, names in enumerate(buckets) if names}
+        # Pre-decode every relationship answer to its name tuple; menu
+        # queries then return these prebuilt tuples with no per-call
+        # id-to-name decoding or list building.
+        for pid in range(n):
+            person = self._people[pid]
+            for op, finder in self._RELATION_FINDERS.items():
+                self._result_cache[(op, pid)] = tuple(
+                    self._names[i] for i in finder(self, person))
+
+    def _parent_ids(self, pid):
+        return self._parent_idx[self._parent_indptr[pid]:self._parent_indptr[pid + 1]]
+
+    def _child_ids(self, pid):
+        return self._child_idx[self._child_indptr[pid]:self._child_indptr[pid + 1]]
 
     def get_person(self, name):
         """Retrieve a person from the family tree by name."""
@@ -89,83 +277,96 @@ class FamilyTree:
 
     def get_member_details(self, name):
         """Display details about a member using polymorphism."""
-        person = self.get_person(name)
-        if person:
-            return person.display_details()
+        pid = self._name_to_id.get(name)
+        if pid is not None:
+            return _details_by_id(pid)
         return "Person not found."
 
-    # Relationship Methods
+    # Relationship Methods: all return tuples of integer person ids
     def find_parents(self, person):
-        return person.parents
+        return tuple(self._parent_ids(person.id))
 
     def find_grandparents(self, person):
-        grandparents = []
-        for parent in person.parents:
-            grandparents.extend(parent.parents)
-        return grandparents
+        return self._grandparents[person.id]
 
     def find_siblings(self, person):
-        siblings = set()
-        for parent in person.parents:
-            siblings.update(parent.children)
-        siblings.discard(person)  # Exclude the person themselves
-        return list(siblings)
+        return self._siblings[person.id]
 
     def find_cousins(self, person):
-        cousins = []
-        for parent in person.parents:
-            for sibling in self.find_siblings(parent):  # Parents' siblings
-                cousins.extend(sibling.children)  # Children of parents' siblings
-        return cousins
+        return self._cousins[person.id]
 
     def find_immediate_family(self, person):
-        immediate_family = set()
-        immediate_family.update(person.parents)
-        immediate_family.update(self.find_siblings(person))
-        if person.spouse:
-            immediate_family.add(person.spouse)
-        immediate_family.update(person.children)
-        return list(immediate_family)
+        pid = person.id
+        ids = set(self._parent_ids(pid))
+        ids.update(self._siblings[pid])
+        if person.spouse is not None:
+            ids.add(person.spouse.id)
+        ids.update(self._child_ids(pid))
+        return tuple(sorted(ids))
 
     def find_extended_family(self, person):
-        extended_family = set()
-        extended_family.update(self.find_immediate_family(person))  # Start with immediate family
-        for parent in person.parents:
-            for sibling in self.find_siblings(parent):  # Aunts/Uncles
-                extended_family.add(sibling)
-                extended_family.update(sibling.children)  # Cousins
-        # Filter only living relatives
-        return [member for member in extended_family if isinstance(member, LivingPerson)]
+        return self._extended_living[person.id]
+
+    _RELATION_FINDERS = {
+        "Parents": find_parents,
+        "Grandparents": find_grandparents,
+        "Siblings": find_siblings,
+        "Cousins": find_cousins,
+        "Immediate Family": find_immediate_family,
+        "Extended Family": find_extended_family,
+    }
+
+    def relation_names(self, op, person):
+        """Prebuilt name tuple answering a relationship query."""
+        return self._result_cache[(op, person.id)]
+
+    def build_snapshot(self):
+        """Partially evaluate the finalized tree into a generated module.
+
+        Emits source code whose relationship tables, details, calendar
+        and statistics are plain literals, and exec()s it into a fresh
+        module; every menu answer then comes from a constant table with
+        no graph state behind it.
+        """
+        n = len(self._people)
+        lines = ['"""Auto-generated snapshot of the finalized family tree."""']
+        for op in self._RELATION_FINDERS:
+            table = {self._names[pid]: self._result_cache[(op, pid)]
+                     for pid in range(n)}
+            lines.append(f"{op.upper().replace(' ', '_')} = {table!r}")
+        details = {self._names[pid]: self._people[pid].display_details()
+                   for pid in range(n)}
+        lines.append(f"DETAILS = {details!r}")
+        lines.append(f"CALENDAR = {self._birthday_calendar!r}")
+        lines.append(f"AVERAGE_AGE = {self.calculate_average_age()!r}")
+        children_data, average_children = self.calculate_children_statistics()
+        lines.append(f"CHILDREN_DATA = {children_data!r}")
+        lines.append(f"AVERAGE_CHILDREN = {average_children!r}")
+        module = types.ModuleType("family_tree_snapshot")
+        exec(compile("\n".join(lines), "<family_tree_snapshot>", "exec"),
+             module.__dict__)
+        return module
 
     def get_birthdays_calendar(self):
-        birthday_calendar = defaultdict(list)
-        for person in self.members.values():
-            if person.birth_date:
-                birthday_calendar[(person.birth_date.month, person.birth_date.day)].append(person.name)
-        return dict(sorted(birthday_calendar.items()))
+        """Return the calendar precomputed by finalize(), keyed by
+        (month << 5) | day packed ints."""
+        return self._birthday_calendar
 
     def calculate_average_age(self):
-        total_age = 0
-        count = 0
-        for person in self.members.values():
-            if isinstance(person, DeceasedPerson):  # Only deceased persons have age at death
-                age_at_death = (person.death_date - person.birth_date).days // 365
-                total_age += age_at_death
-                count += 1
-        return total_age / count if count > 0 else 0
+        return _avg_age_kernel(self._birth_ord, self._death_ord)
 
     def calculate_children_statistics(self):
-        total_children = 0
-        num_people = len(self.members)
-        children_data = {}
+        counts = _child_counts_kernel(self._child_indptr)
+        children_data = dict(zip(self._names, counts))
+        average_children = sum(counts) / len(counts) if counts else 0
+        return children_data, average_children
 
-        for person in self.members.values():
-            children_count = len(person.children)
-            children_data[person.name] = children_count
-            total_children += children_count
+@lru_cache(maxsize=512)
+def _details_by_id(pid):
+    """Format a person's details once per id; the tree never changes after
+    setup, so repeated menu queries return the cached string."""
+    return family_tree._people[pid].display_details()
 
-        average_children = total_children / num_people if num_people > 0 else 0
-        return children_data, average_children
 
 # Initialize FamilyTree
 family_tree = FamilyTree()
@@ -180,134 +381,130 @@ hans = DeceasedPerson("Hans Emmersohn", date(1940, 3, 22), date(2012, 7, 10))
 child1 = LivingPerson("Lucas Emmersohn", date(1992, 11, 12))
 child2 = LivingPerson("Emma Emmersohn", date(1995, 2, 28))
 
-# Set relationships using set_parents and set_children
-cornelia.set_parents([anna, raj])
-otto.set_parents([maria, hans])
-
-cornelia.set_children([child1, child2])
-otto.set_children([child1, child2])
+# Add members to the family tree, assigning ids in insertion order
+for member in (cornelia, otto, anna, raj, maria, hans, child1, child2):
+    family_tree.add_member(member)
+
+# Register every parent->child edge in a single pass
+family_tree.add_edges([
+    (anna.name, cornelia.name),
+    (raj.name, cornelia.name),
+    (maria.name, otto.name),
+    (hans.name, otto.name),
+    (cornelia.name, child1.name),
+    (otto.name, child1.name),
+    (cornelia.name, child2.name),
+    (otto.name, child2.name),
+])
 
 # Set spouse relationships
 cornelia.spouse = otto
 
-# Add members directly to the family tree
-family_tree.members = {
-    cornelia.name: cornelia,
-    otto.name: otto,
-    anna.name: anna,
-    raj.name: raj,
-    maria.name: maria,
-    hans.name: hans,
-    child1.name: child1,
-    child2.name: child2
+# Freeze the tree into its packed adjacency representation, then
+# specialize it into a module of literal lookup tables for the menu
+family_tree.finalize()
+SNAPSHOT = family_tree.build_snapshot()
+
+# The menu text never changes, so it is one prebuilt string written in a
+# single call rather than thirteen print()s per iteration
+MENU = "\n".join((
+    "",
+    "--- Family Tree Menu ---",
+    "1. View Member Details",
+    "2. View Parents",
+    "3. View Grandparents",
+    "4. View Immediate Family",
+    "5. View Extended Family",
+    "6. View Siblings",
+    "7. View Cousins",
+    "8. View Birthday Calendar",
+    "9. View Average Age at Death",
+    "10. View Number of Children and Average Children per Person",
+    "11. Exit",
+    "",
+))
+
+def _read_line(prompt):
+    """Prompt and read one line via sys.stdin; returns None at EOF.
+
+    Flushing only here, right before blocking on input, keeps the rest of
+    the menu loop free to buffer its writes.
+    """
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        return None
+    return line.rstrip("\n")
+
+def _with_person(action):
+    """Prompt for a name, check it is known and build the action's response."""
+    name = _read_line("Enter the name of the person: ")
+    if name in SNAPSHOT.DETAILS:
+        return action(name)
+    return "Person not found.\n"
+
+def _relation_viewer(label):
+    """Build a menu handler answering the `label` relation for a prompted person."""
+    table = getattr(SNAPSHOT, label.upper().replace(" ", "_"))
+    def handler():
+        return _with_person(lambda name: f"{label} of {name}: {', '.join(table[name])}\n")
+    return handler
+
+def _view_details():
+    name = _read_line("Enter the name of the person: ")
+    return SNAPSHOT.DETAILS.get(name, "Person not found.") + "\n"
+
+def _view_birthdays():
+    parts = ["Family Birthday Calendar:\n"]
+    for key, names in SNAPSHOT.CALENDAR.items():
+        parts.append(f"{key & 31:02d}/{key >> 5:02d}: {', '.join(names)}\n")
+    return "".join(parts)
+
+def _view_average_age():
+    return f"The average age at death is: {SNAPSHOT.AVERAGE_AGE:.2f} years\n"
+
+def _view_children_statistics():
+    parts = ["Number of children per individual:\n"]
+    for name, count in SNAPSHOT.CHILDREN_DATA.items():
+        parts.append(f"{name}: {count}\n")
+    parts.append(f"The average number of children per person is: {SNAPSHOT.AVERAGE_CHILDREN:.2f}\n")
+    return "".join(parts)
+
+def _exit():
+    return "Exiting the program. Goodbye!\n"
+
+def _invalid():
+    return "Invalid choice. Please try again.\n"
+
+# One hash probe replaces the old 11-way match cascade
+DISPATCH = {
+    "1": _view_details,
+    "2": _relation_viewer("Parents"),
+    "3": _relation_viewer("Grandparents"),
+    "4": _relation_viewer("Immediate Family"),
+    "5": _relation_viewer("Extended Family"),
+    "6": _relation_viewer("Siblings"),
+    "7": _relation_viewer("Cousins"),
+    "8": _view_birthdays,
+    "9": _view_average_age,
+    "10": _view_children_statistics,
+    "11": _exit,
 }
 
-def display_menu():
-    print("\n--- Family Tree Menu ---")
-    print("1. View Member Details")
-    print("2. View Parents")
-    print("3. View Grandparents")
-    print("4. View Immediate Family")
-    print("5. View Extended Family")
-    print("6. View Siblings")
-    print("7. View Cousins")
-    print("8. View Birthday Calendar")
-    print("9. View Average Age at Death")
-    print("10. View Number of Children and Average Children per Person")
-    print("11. Exit")
-
 def handle_choice(choice):
-    match choice:
-        case "1":  # View Member Details
-            name = input("Enter the name of the person: ")
-            print(family_tree.get_member_details(name))
-
-        case "2":  # View Parents
-            name = input("Enter the name of the person: ")
-            person = family_tree.get_person(name)
-            if person:
-                parents = family_tree.find_parents(person)
-                print(f"Parents of {name}: {[str(parent) for parent in parents]}")
-            else:
-                print("Person not found.")
-
-        case "3":  # View Grandparents
-            name = input("Enter the name of the person: ")
-            person = family_tree.get_person(name)
-            if person:
-                grandparents = family_tree.find_grandparents(person)
-                print(f"Grandparents of {name}: {[str(grandparent) for grandparent in grandparents]}")
-            else:
-                print("Person not found.")
-
-        case "4":  # View Immediate Family
-            name = input("Enter the name of the person: ")
-            person = family_tree.get_person(name)
-            if person:
-                immediate_family = family_tree.find_immediate_family(person)
-                print(f"Immediate Family of {name}: {[str(member) for member in immediate_family]}")
-            else:
-                print("Person not found.")
-
-        case "5":  # View Extended Family
-            name = input("Enter the name of the person: ")
-            person = family_tree.get_person(name)
-            if person:
-                extended_family = family_tree.find_extended_family(person)
-                print(f"Extended Family of {name}: {[str(member) for member in extended_family]}")
-            else:
-                print("Person not found.")
-
-        case "6":  # View Siblings
-            name = input("Enter the name of the person: ")
-            person = family_tree.get_person(name)
-            if person:
-                siblings = family_tree.find_siblings(person)
-                print(f"Siblings of {name}: {[str(sibling) for sibling in siblings]}")
-            else:
-                print("Person not found.")
-
-        case "7":  # View Cousins
-            name = input("Enter the name of the person: ")
-            person = family_tree.get_person(name)
-            if person:
-                cousins = family_tree.find_cousins(person)
-                print(f"Cousins of {name}: {[str(cousin) for cousin in cousins]}")
-            else:
-                print("Person not found.")
-
-        case "8":  # View Birthday Calendar
-            print("Family Birthday Calendar:")
-            birthday_calendar = family_tree.get_birthdays_calendar()
-            for date, names in birthday_calendar.items():
-                print(f"{date[1]:02d}/{date[0]:02d}: {', '.join(names)}")
-
-        case "9":  # View Average Age at Death
-            avg_age = family_tree.calculate_average_age()
-            print(f"The average age at death is: {avg_age:.2f} years")
-
-        case "10":  # View Number of Children and Average Children per Person
-            children_data, avg_children = family_tree.calculate_children_statistics()
-            print("Number of children per individual:")
-            for name, count in children_data.items():
-                print(f"{name}: {count}")
-            print(f"The average number of children per person is: {avg_children:.2f}")
-
-        case "11":  # Exit
-            print("Exiting the program. Goodbye!")
-            return False
-
-        case _:  # Invalid Choice
-            print("Invalid choice. Please try again.")
-
-    return True
+    """Write the response for one menu choice; returns False on exit."""
+    sys.stdout.write(DISPATCH.get(choice, _invalid)())
+    return choice != "11"
 
 
 def main():
     while True:
-        display_menu()
-        if not handle_choice(input("Enter your choice: ")):
+        sys.stdout.write(MENU)
+        choice = _read_line("Enter your choice: ")
+        if choice is None or not handle_choice(choice):
             break
+    sys.stdout.flush()
 
 if __name__ == "__main__":
     main()